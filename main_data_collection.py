@@ -1,5 +1,15 @@
 # main_data_collection.py
-def main():
+import pandas as pd
+
+def save_training_data(data, write_csv=False):
+    """Write the final dataset as Parquet, with an optional .csv copy"""
+    data['compound'] = data['compound'].astype('category')
+    data.to_parquet('final_training_data.parquet', engine='pyarrow',
+                    compression='snappy', index=False)
+    if write_csv:
+        data.to_csv('final_training_data.csv', index=False)
+
+def main(write_csv=False):
     print("🚀 Chemical Property Prediction - Data Collection")
     print("=" * 50)
     
@@ -7,7 +17,8 @@ def main():
         # Method 1: Try NIST scraping first
         print("Attempting NIST data collection...")
         from quick_data_collection import collect_hackathon_dataset
-        data = collect_hackathon_dataset()
+        training_data_path = collect_hackathon_dataset(write_csv=write_csv)
+        data = pd.read_parquet(training_data_path)
         
         # More lenient threshold - accept any data collected
         if len(data) < 20:
@@ -21,7 +32,7 @@ def main():
         print(f"Heat capacity range: {data['heat_capacity'].min():.1f} - {data['heat_capacity'].max():.1f} J/(mol·K)")
         
         # Save for model training
-        data.to_csv('final_training_data.csv', index=False)
+        save_training_data(data, write_csv)
         print("✅ Data ready for model training!")
         
         return data
@@ -35,7 +46,7 @@ def main():
         data = generate_synthetic_supplement(0)
         
         print(f"✅ Emergency dataset created with {len(data)} samples")
-        data.to_csv('final_training_data.csv', index=False)
+        save_training_data(data, write_csv)
         
         return data
 
@@ -1,84 +1,276 @@
 # nist_scraper.py
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import aiohttp
+import asyncio
+from aiolimiter import AsyncLimiter
+from bs4 import BeautifulSoup, SoupStrainer
+import lxml.html
+from lxml import etree
 import pandas as pd
 import numpy as np
-import time
 import re
+import time
 import json
+import orjson
+import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from io import StringIO
 from urllib.parse import urlencode, quote
-import warnings
-warnings.filterwarnings('ignore')
+
+# Statuses worth retrying: rate limiting and transient server errors
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Request rate we allow ourselves against webbook.nist.gov
+MAX_REQUESTS_PER_SECOND = 2
+
+# Search strategies tried in order: the query key for the search term, plus extra params
+SEARCH_STRATEGIES = [
+    ('Formula', {'NoIon': 'on', 'Units': 'SI'}),
+    ('Name', {'NoIon': 'on', 'Units': 'SI'}),
+    ('Formula', {'Units': 'SI'}),
+    ('Name', {'Units': 'SI'})
+]
+
+# Page queries for a compound ID
+THERMO_QUERY = {
+    'Mask': '1',  # Thermochemical data
+    'Type': 'JANAFG',  # JANAF tables
+    'Units': 'SI'
+}
+PHASE_CHANGE_QUERY = {
+    'Mask': '4',  # Phase change data
+    'Units': 'SI'
+}
+
+# Precompiled patterns, used for every table cell and search result
+_NUM_CLEAN = re.compile(r'[^\d.+-eE×]')
+_NUM_EXTRACT = re.compile(r'[-+]?[0-9]*\.?[0-9]+(?:[eE][-+]?[0-9]+)?')
+_ID_HREF = re.compile(r'ID=(C\d+)')
+
+# Thermodynamic table columns, in JANAF table order and in output order
+JANAF_COLUMNS = ['temperature', 'heat_capacity', 'entropy', 'gibbs_free_energy', 'enthalpy_minus_h298']
+THERMO_COLUMNS = ['temperature', 'heat_capacity', 'entropy', 'enthalpy_minus_h298', 'gibbs_free_energy']
+
+# Innermost tables with a header cell naming a thermodynamic quantity (case-insensitive)
+_THERMO_KEYWORDS = [
+    'temperature', 'heat capacity', 'entropy', 'cp°', 'cp',
+    'enthalpy', 'gibbs', 'janaf', 'thermodynamic'
+]
+_THERMO_TABLES = etree.XPath(
+    '//table[not(.//table)][.//th[{}]]'.format(' or '.join(
+        f"contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{keyword}')"
+        for keyword in _THERMO_KEYWORDS
+    ))
+)
+
+def _parse_thermodynamic_tables(html):
+    """Parse thermodynamic data tables from a JANAF page with pandas.read_html
+    
+    Module-level and pure so it can run in a worker process.
+    """
+    # Layout tables are skipped by the XPath, in C, before pandas sees anything
+    thermo_tables = _THERMO_TABLES(lxml.html.fromstring(html))
+    if not thermo_tables:
+        return None
+    
+    tables_html = ''.join(lxml.html.tostring(table, encoding='unicode') for table in thermo_tables)
+    tables = pd.read_html(StringIO(tables_html), flavor='lxml')
+    
+    frames = []
+    
+    for table in tables:
+        # JANAF column order: T, Cp, S, -(G-H)/T, H-H(298)
+        table = table.iloc[:, :len(JANAF_COLUMNS)]
+        table.columns = JANAF_COLUMNS[:table.shape[1]]
+        
+        # Coerce once here so every consumer gets float64 columns
+        table = table.reindex(columns=THERMO_COLUMNS).apply(pd.to_numeric, errors='coerce')
+        table = table.astype('float64')
+        
+        # Reasonable temperature range and valid heat capacity
+        frames.append(table[table['temperature'].between(50, 5000) & (table['heat_capacity'] > 0)])
+    
+    data = pd.concat(frames, ignore_index=True) if frames else None
+    return data if data is not None and len(data) else None
+
+def _parse_phase_change_data(html):
+    """Parse phase change properties from a phase change page"""
+    soup = BeautifulSoup(html, 'lxml', parse_only=SoupStrainer('table'))
+    phase_data = {}
+    
+    # Look for phase change tables
+    tables = soup.find_all('table')
+    
+    for table in tables:
+        rows = table.find_all('tr')
+        
+        for row in rows:
+            cells = row.find_all('td')
+            if len(cells) < 2:
+                continue
+            
+            # Skip cells without any number before doing the full parse
+            value_text = cells[1].get_text(strip=True)
+            if not _NUM_EXTRACT.search(value_text):
+                continue
+            
+            property_name = cells[0].get_text(strip=True).lower()
+            value = _parse_number(value_text)
+            
+            if 'boiling' in property_name or 'vaporization' in property_name:
+                if 'temperature' in property_name or 'point' in property_name:
+                    phase_data['boiling_point_K'] = value
+                elif 'enthalpy' in property_name:
+                    phase_data['heat_of_vaporization'] = value
+            
+            elif 'melting' in property_name or 'fusion' in property_name:
+                if 'temperature' in property_name or 'point' in property_name:
+                    phase_data['melting_point_K'] = value
+                elif 'enthalpy' in property_name:
+                    phase_data['heat_of_fusion'] = value
+    
+    return phase_data
+
+def _parse_number(text):
+    """Extract numerical value from text with improved parsing"""
+    if not text or text == '-' or text == '':
+        return None
+    
+    # Handle scientific notation and various formats
+    text = text.strip()
+    
+    # Remove common non-numeric characters but keep scientific notation
+    cleaned = _NUM_CLEAN.sub('', text)
+    cleaned = cleaned.replace('×', 'e')  # Handle × notation
+    
+    # Check the shape up front instead of letting float() raise on every bad cell
+    if _NUM_EXTRACT.fullmatch(cleaned):
+        return float(cleaned)
+    
+    # Otherwise take the first number in the string (also covers ± ranges)
+    number = _NUM_EXTRACT.search(text)
+    return float(number.group(0)) if number else None
 
 class NISTChemicalDataScraper:
-    def __init__(self, delay=1.0):
+    def __init__(self, delay=1.0, max_concurrency=16, max_retries=3, cache_path='nist_id_cache.json'):
         """
         NIST Chemistry WebBook scraper
         
         Args:
-            delay (float): Delay between requests to be respectful
+            delay (float): Base delay for the exponential retry backoff
+            max_concurrency (int): Maximum in-flight requests when scraping many compounds
+            max_retries (int): Retries on 429/5xx responses, with exponential backoff
+            cache_path (str): JSON file caching compound IDs across runs (None disables it)
         """
         self.base_url = "https://webbook.nist.gov/cgi/cbook.cgi"
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
+        }
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        # Keep-alive pool sized for the workload; the adapter retries 429/5xx itself
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            max_retries=Retry(total=max_retries, backoff_factor=delay,
+                              status_forcelist=sorted(RETRY_STATUSES))
+        )
+        self.session.mount('https://', adapter)
         self.delay = delay
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        # Token bucket shared by all in-flight requests; created per run, since an
+        # AsyncLimiter must not be reused across the event loops of asyncio.run
+        self._limiter = None
+        # The sync path keeps a minimum gap between requests instead
+        self._last_request = 0.0
+        
+        # Compound IDs found by earlier runs, so repeat searches are skipped
+        self.cache_path = cache_path
+        self._id_cache = {}
+        if cache_path and os.path.exists(cache_path):
+            try:
+                with open(cache_path, 'rb') as f:
+                    self._id_cache = dict(orjson.loads(f.read()))
+            except (OSError, ValueError, TypeError) as e:
+                print(f"Ignoring unreadable compound ID cache {cache_path}: {e}")
         
     def search_compound(self, formula_or_name):
         """Search for a compound and get its ID"""
-        # Try multiple search strategies
-        search_attempts = [
-            {'Formula': formula_or_name, 'NoIon': 'on', 'Units': 'SI'},
-            {'Name': formula_or_name, 'NoIon': 'on', 'Units': 'SI'},
-            {'Formula': formula_or_name, 'Units': 'SI'},
-            {'Name': formula_or_name, 'Units': 'SI'}
-        ]
-        
-        for params in search_attempts:
-            try:
-                response = self.session.get(self.base_url, params=params, timeout=15)
-                response.raise_for_status()
-                
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # Look for compound links with more flexible patterns
-                compound_links = soup.find_all('a', href=re.compile(r'ID=C\d+'))
+        if formula_or_name in self._id_cache:
+            return self._id_cache[formula_or_name]
+        
+        
+        try:
+            # Try multiple search strategies
+            for key, extra in SEARCH_STRATEGIES:
+                params = {key: formula_or_name, **extra}
+                response = self._get(params, timeout=15)
                 
-                if compound_links:
-                    href = compound_links[0]['href']
-                    compound_id = re.search(r'ID=(C\d+)', href).group(1)
+                compound_id = self._extract_compound_id(response.content, response.url)
+                if compound_id:
                     print(f"Found compound ID: {compound_id} for {formula_or_name}")
+                    self._cache_compound_id(formula_or_name, compound_id)
                     return compound_id
                     
-                # Also check for direct compound pages
-                if 'ID=C' in response.url:
-                    compound_id = re.search(r'ID=(C\d+)', response.url)
-                    if compound_id:
-                        return compound_id.group(1)
-                        
-            except Exception as e:
-                print(f"Search attempt failed for {formula_or_name}: {e}")
-                continue
+        except Exception as e:
+            print(f"Search failed for {formula_or_name}: {e}")
+            return None
         
         print(f"No compound found for: {formula_or_name}")
         return None
 
+    def _get(self, params, timeout=10):
+        """GET against the WebBook, throttled to MAX_REQUESTS_PER_SECOND like the async path"""
+        wait = self._last_request + 1 / MAX_REQUESTS_PER_SECOND - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        self._last_request = time.monotonic()
+        
+        response = self.session.get(self.base_url, params=params, timeout=timeout)
+        response.raise_for_status()
+        return response
+    
+    def _cache_compound_id(self, formula_or_name, compound_id):
+        """Remember a compound ID and persist the cache atomically"""
+        self._id_cache[formula_or_name] = compound_id
+        if not self.cache_path:
+            return
+        
+        tmp_path = f'{self.cache_path}.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps(self._id_cache))
+        os.replace(tmp_path, self.cache_path)
+    
+    def _extract_compound_id(self, html, url):
+        """Pull the NIST compound ID out of a search results page"""
+        # Only build the compound links, everything else on the page is skipped
+        only_links = SoupStrainer('a', href=_ID_HREF)
+        soup = BeautifulSoup(html, 'lxml', parse_only=only_links)
+        
+        compound_link = soup.find('a')
+        if compound_link:
+            return _ID_HREF.search(compound_link['href']).group(1)
+            
+        # Also check for direct compound pages
+        if 'ID=C' in url:
+            compound_id = _ID_HREF.search(url)
+            if compound_id:
+                return compound_id.group(1)
+        
+        return None
+
     def get_thermodynamic_data(self, compound_id):
         """Get thermodynamic data for a compound"""
-        params = {
-            'ID': compound_id,
-            'Mask': '1',  # Thermochemical data
-            'Type': 'JANAFG',  # JANAF tables
-            'Units': 'SI'
-        }
+        params = {'ID': compound_id, **THERMO_QUERY}
         
         try:
-            response = self.session.get(self.base_url, params=params, timeout=10)
-            response.raise_for_status()
+            response = self._get(params)
             
-            soup = BeautifulSoup(response.text, 'html.parser')
-            return self._parse_thermodynamic_tables(soup)
+            return _parse_thermodynamic_tables(response.content)
             
         except Exception as e:
             print(f"Error getting thermodynamic data for {compound_id}: {e}")
@@ -86,151 +278,17 @@ class NISTChemicalDataScraper:
     
     def get_phase_change_data(self, compound_id):
         """Get phase change data (boiling point, melting point, etc.)"""
-        params = {
-            'ID': compound_id,
-            'Mask': '4',  # Phase change data
-            'Units': 'SI'
-        }
+        params = {'ID': compound_id, **PHASE_CHANGE_QUERY}
         
         try:
-            response = self.session.get(self.base_url, params=params, timeout=10)
-            response.raise_for_status()
+            response = self._get(params)
             
-            soup = BeautifulSoup(response.text, 'html.parser')
-            return self._parse_phase_change_data(soup)
+            return _parse_phase_change_data(response.content)
             
         except Exception as e:
             print(f"Error getting phase change data for {compound_id}: {e}")
             return {}
     
-    def _parse_thermodynamic_tables(self, soup):
-        """Parse thermodynamic data tables with improved robustness"""
-        data = {
-            'temperature': [],
-            'heat_capacity': [],
-            'entropy': [],
-            'enthalpy_minus_h298': [],
-            'gibbs_free_energy': []
-        }
-        
-        # Look for thermodynamic tables
-        tables = soup.find_all('table')
-        
-        for table in tables:
-            # Check if this is a thermodynamic table
-            headers = table.find_all('th')
-            if not headers:
-                continue
-                
-            header_text = ' '.join([th.get_text().strip() for th in headers])
-            
-            # More comprehensive keyword matching
-            thermo_keywords = [
-                'temperature', 'heat capacity', 'entropy', 'cp°', 'cp',
-                'enthalpy', 'gibbs', 'janaf', 'thermodynamic'
-            ]
-            
-            if any(keyword in header_text.lower() for keyword in thermo_keywords):
-                rows = table.find_all('tr')[1:]  # Skip header row
-                
-                for row in rows:
-                    cells = row.find_all('td')
-                    if len(cells) >= 2:  # At least temperature and one property
-                        try:
-                            # Try to parse temperature from first column
-                            temp = self._parse_number(cells[0].get_text().strip())
-                            if temp is None or temp < 50 or temp > 5000:  # Reasonable temperature range
-                                continue
-                            
-                            # Try to find heat capacity in any column
-                            cp = None
-                            entropy = None
-                            enthalpy = None
-                            gibbs = None
-                            
-                            for i, cell in enumerate(cells[1:], 1):
-                                value = self._parse_number(cell.get_text().strip())
-                                if value is not None:
-                                    if i == 1:  # Usually Cp
-                                        cp = value
-                                    elif i == 2:  # Usually entropy
-                                        entropy = value
-                                    elif i == 3:  # Usually Gibbs function
-                                        gibbs = value
-                                    elif i == 4:  # Usually enthalpy
-                                        enthalpy = value
-                            
-                            if cp is not None and cp > 0:  # Valid heat capacity
-                                data['temperature'].append(temp)
-                                data['heat_capacity'].append(cp)
-                                data['entropy'].append(entropy)
-                                data['enthalpy_minus_h298'].append(enthalpy)
-                                data['gibbs_free_energy'].append(gibbs)
-                                
-                        except Exception as e:
-                            continue
-        
-        return pd.DataFrame(data) if data['temperature'] else None
-    
-    def _parse_phase_change_data(self, soup):
-        """Parse phase change properties"""
-        phase_data = {}
-        
-        # Look for phase change tables
-        tables = soup.find_all('table')
-        
-        for table in tables:
-            rows = table.find_all('tr')
-            
-            for row in rows:
-                cells = row.find_all('td')
-                if len(cells) >= 2:
-                    property_name = cells[0].get_text().strip().lower()
-                    value_text = cells[1].get_text().strip()
-                    
-                    # Extract numerical value
-                    value = self._parse_number(value_text)
-                    
-                    if value is not None:
-                        if 'boiling' in property_name or 'vaporization' in property_name:
-                            if 'temperature' in property_name or 'point' in property_name:
-                                phase_data['boiling_point_K'] = value
-                            elif 'enthalpy' in property_name:
-                                phase_data['heat_of_vaporization'] = value
-                                
-                        elif 'melting' in property_name or 'fusion' in property_name:
-                            if 'temperature' in property_name or 'point' in property_name:
-                                phase_data['melting_point_K'] = value
-                            elif 'enthalpy' in property_name:
-                                phase_data['heat_of_fusion'] = value
-        
-        return phase_data
-    
-    def _parse_number(self, text):
-        """Extract numerical value from text with improved parsing"""
-        if not text or text == '-' or text == '':
-            return None
-            
-        # Handle scientific notation and various formats
-        text = text.strip()
-        
-        # Remove common non-numeric characters but keep scientific notation
-        cleaned = re.sub(r'[^\d.+-eE×]', '', text)
-        cleaned = cleaned.replace('×', 'e')  # Handle × notation
-        
-        # Handle ranges (take first value)
-        if '±' in text:
-            cleaned = cleaned.split('±')[0]
-        
-        try:
-            return float(cleaned)
-        except ValueError:
-            # Try to extract first number from string
-            numbers = re.findall(r'[-+]?[0-9]*\.?[0-9]+(?:[eE][-+]?[0-9]+)?', text)
-            if numbers:
-                return float(numbers[0])
-            return None
-    
     def scrape_compound_data(self, formula_or_name):
         """Scrape all available data for a compound"""
         print(f"Scraping data for: {formula_or_name}")
@@ -243,11 +301,9 @@ class NISTChemicalDataScraper:
         print(f"Found compound ID: {compound_id}")
         
         # Get thermodynamic data
-        time.sleep(self.delay)
         thermo_data = self.get_thermodynamic_data(compound_id)
         
         # Get phase change data
-        time.sleep(self.delay)
         phase_data = self.get_phase_change_data(compound_id)
         
         return {
@@ -257,65 +313,209 @@ class NISTChemicalDataScraper:
             'phase_change_data': phase_data
         }
     
-    def scrape_multiple_compounds(self, compound_list, save_progress=True):
-        """Scrape data for multiple compounds"""
+    def scrape_multiple_compounds(self, compound_list, save_progress=True, on_result=None):
+        """Scrape data for multiple compounds concurrently
+        
+        Args:
+            compound_list (list): Formulas or names to scrape
+            save_progress (bool): Save results to JSON every 5 compounds
+            on_result (callable): Called as on_result(compound, data) as each compound completes;
+                results are then handed off instead of returned
+        
+        Returns:
+            dict: compound -> scraped data in request order, or None when on_result is given
+        """
+        return asyncio.run(self._ascrape_multiple_compounds(compound_list, save_progress, on_result))
+    
+    async def _ascrape_multiple_compounds(self, compound_list, save_progress, on_result=None):
+        """Fetch all compounds in parallel, bounded by max_concurrency"""
+        # NIST politeness without serializing the requests
+        self._limiter = AsyncLimiter(max_rate=MAX_REQUESTS_PER_SECOND, time_period=1.0)
         results = {}
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        completed = 0
         
-        for i, compound in enumerate(compound_list):
-            print(f"\nProgress: {i+1}/{len(compound_list)}")
-            
-            try:
-                data = self.scrape_compound_data(compound)
-                if data:
-                    results[compound] = data
+        connector = aiohttp.TCPConnector(limit_per_host=8)
+        # HTML parsing is CPU-bound, so pages are parsed in a few worker processes;
+        # the rate limit keeps pages slow enough that more workers would sit idle
+        # Spawned, not forked: the loop already has resolver threads when workers start
+        workers = min(os.cpu_count() or 1, self.max_concurrency, 4)
+        with ProcessPoolExecutor(max_workers=workers,
+                                 mp_context=multiprocessing.get_context('spawn')) as pool:
+            async with aiohttp.ClientSession(headers=self.headers, connector=connector) as session:
+                
+                async def bounded_scrape(compound):
+                    nonlocal completed
+                    async with semaphore:
+                        try:
+                            data = await self._ascrape_compound_data(session, pool, compound)
+                        except Exception as e:
+                            print(f"Error scraping {compound}: {e}")
+                            data = None
                     
-                    # Save progress periodically
-                    if save_progress and (i+1) % 5 == 0:
-                        self.save_data(results, f'nist_data_progress_{i+1}.json')
+                    completed += 1
+                    print(f"\nProgress: {completed}/{len(compound_list)}")
+                    if data:
+                        # Only hold on to results someone still needs (progress files)
+                        if on_result is None or save_progress:
+                            results[compound] = data
                         
-            except Exception as e:
-                print(f"Error scraping {compound}: {e}")
-                continue
+                        if on_result:
+                            try:
+                                on_result(compound, data)
+                            except Exception as e:
+                                print(f"Error handling result for {compound}: {e}")
+                        
+                        # Save progress periodically
+                        if save_progress and completed % 5 == 0:
+                            self.save_data(results, f'nist_data_progress_{completed}.json')
+                    
+                    return data if on_result is None else None
+                
+                scraped = await asyncio.gather(*[bounded_scrape(c) for c in compound_list])
+        
+        if on_result:
+            return None
+        
+        # Return results in the order they were requested
+        return {compound: data for compound, data in zip(compound_list, scraped) if data}
+    
+    async def _aget(self, session, params, timeout=10):
+        """Rate-limited GET against the WebBook, retrying 429/5xx, connection errors
+        and timeouts with exponential backoff
+        
+        Returns the raw body bytes; lxml reads the charset from the page itself.
+        """
+        for attempt in range(self.max_retries + 1):
+            try:
+                async with self._limiter:
+                    async with session.get(self.base_url, params=params,
+                                           timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                        if response.status not in RETRY_STATUSES or attempt == self.max_retries:
+                            response.raise_for_status()
+                            return await response.read(), str(response.url)
             
-            # Be respectful to NIST servers
-            time.sleep(self.delay)
+            # Dropped connections and timeouts are transient too, like the sync adapter treats them
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt == self.max_retries:
+                    raise
+            
+            await asyncio.sleep(self.delay * 2 ** attempt)
+    
+    async def _asearch_compound(self, session, formula_or_name):
+        """Async variant of search_compound"""
+        if formula_or_name in self._id_cache:
+            return self._id_cache[formula_or_name]
+        
         
-        return results
+        try:
+            # Try multiple search strategies
+            for key, extra in SEARCH_STRATEGIES:
+                params = {key: formula_or_name, **extra}
+                html, url = await self._aget(session, params, timeout=15)
+                compound_id = self._extract_compound_id(html, url)
+                if compound_id:
+                    print(f"Found compound ID: {compound_id} for {formula_or_name}")
+                    self._cache_compound_id(formula_or_name, compound_id)
+                    return compound_id
+                    
+        except Exception as e:
+            print(f"Search failed for {formula_or_name}: {e}")
+            return None
+        
+        print(f"No compound found for: {formula_or_name}")
+        return None
+    
+    async def _aget_thermodynamic_data(self, session, pool, compound_id):
+        """Async variant of get_thermodynamic_data"""
+        params = {'ID': compound_id, **THERMO_QUERY}
+        
+        try:
+            html, _ = await self._aget(session, params)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(pool, _parse_thermodynamic_tables, html)
+            
+        except Exception as e:
+            print(f"Error getting thermodynamic data for {compound_id}: {e}")
+            return None
+    
+    async def _aget_phase_change_data(self, session, pool, compound_id):
+        """Async variant of get_phase_change_data"""
+        params = {'ID': compound_id, **PHASE_CHANGE_QUERY}
+        
+        try:
+            html, _ = await self._aget(session, params)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(pool, _parse_phase_change_data, html)
+            
+        except Exception as e:
+            print(f"Error getting phase change data for {compound_id}: {e}")
+            return {}
+    
+    async def _ascrape_compound_data(self, session, pool, formula_or_name):
+        """Async variant of scrape_compound_data; thermo and phase pages are fetched together"""
+        print(f"Scraping data for: {formula_or_name}")
+        
+        compound_id = await self._asearch_compound(session, formula_or_name)
+        if not compound_id:
+            return None
+        
+        thermo_data, phase_data = await asyncio.gather(
+            self._aget_thermodynamic_data(session, pool, compound_id),
+            self._aget_phase_change_data(session, pool, compound_id)
+        )
+        
+        return {
+            'formula': formula_or_name,
+            'compound_id': compound_id,
+            'thermodynamic_data': thermo_data,
+            'phase_change_data': phase_data
+        }
     
     def save_data(self, data, filename):
         """Save scraped data to file"""
-        # Convert DataFrames to dictionaries for JSON serialization
-        serializable_data = {}
-        
-        for compound, compound_data in data.items():
-            serializable_data[compound] = {
-                'formula': compound_data['formula'],
-                'compound_id': compound_data['compound_id'],
-                'phase_change_data': compound_data['phase_change_data']
-            }
-            
-            # Convert DataFrame to dict
-            if compound_data['thermodynamic_data'] is not None:
-                serializable_data[compound]['thermodynamic_data'] = \
-                    compound_data['thermodynamic_data'].to_dict('records')
-            else:
-                serializable_data[compound]['thermodynamic_data'] = None
+        serializable_data = {
+            compound: self.serialize_compound(compound_data)
+            for compound, compound_data in data.items()
+        }
         
-        with open(filename, 'w') as f:
-            json.dump(serializable_data, f, indent=2)
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(serializable_data, option=orjson.OPT_SERIALIZE_NUMPY))
         
         print(f"Data saved to {filename}")
     
+    def serialize_compound(self, compound_data):
+        """Convert one compound's scraped data to a JSON-serializable dict"""
+        serializable = {
+            'formula': compound_data['formula'],
+            'compound_id': compound_data['compound_id'],
+            'phase_change_data': compound_data['phase_change_data']
+        }
+        
+        # Convert DataFrame to dict
+        if compound_data['thermodynamic_data'] is not None:
+            serializable['thermodynamic_data'] = compound_data['thermodynamic_data'].to_dict('records')
+        else:
+            serializable['thermodynamic_data'] = None
+        
+        return serializable
+    
     def load_data(self, filename):
         """Load previously scraped data"""
-        with open(filename, 'r') as f:
-            data = json.load(f)
+        with open(filename, 'rb') as f:
+            raw = f.read()
+        
+        try:
+            data = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # Files from the old json.dump writer may contain bare NaN, which orjson rejects
+            data = json.loads(raw)
         
         # Convert thermodynamic data back to DataFrames
         for compound in data:
             if data[compound]['thermodynamic_data']:
                 data[compound]['thermodynamic_data'] = pd.DataFrame(
-                    data[compound]['thermodynamic_data']
+                    data[compound]['thermodynamic_data'], dtype='float64'
                 )
         
         return data
\ No newline at end of file
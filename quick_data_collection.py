@@ -1,10 +1,55 @@
 # quick_data_collection.py
 import pandas as pd
 import numpy as np
+import os
+import zlib
+import orjson
+import pyarrow as pa
+import pyarrow.parquet as pq
 from nist_scraper import NISTChemicalDataScraper
 
-def collect_hackathon_dataset():
-    """Collect essential data for hackathon demo"""
+RAW_DATA_PATH = 'hackathon_raw_data.json'
+TRAINING_DATA_PATH = 'hackathon_training_data.parquet'
+CSV_DATA_PATH = 'hackathon_training_data.csv'
+
+# Column layout of the training data, fixed up front so it can be written in chunks
+TRAINING_SCHEMA = pa.schema([
+    ('compound', pa.dictionary(pa.int32(), pa.string())),
+    ('compound_id', pa.int64()),
+    ('temperature', pa.float64()),
+    ('heat_capacity', pa.float64()),
+    ('entropy', pa.float64()),
+    ('enthalpy_minus_h298', pa.float64()),
+    ('molecular_weight', pa.float64()),
+    ('n_atoms', pa.int64()),
+    ('is_polar', pa.int64())
+])
+
+# Basic molecular properties, shared read-only by every lookup
+_MOL_PROPS = {
+    'H2O': {'molecular_weight': 18.015, 'n_atoms': 3, 'is_polar': 1},
+    'CO2': {'molecular_weight': 44.01, 'n_atoms': 3, 'is_polar': 0},
+    'CH4': {'molecular_weight': 16.04, 'n_atoms': 5, 'is_polar': 0},
+    'NH3': {'molecular_weight': 17.03, 'n_atoms': 4, 'is_polar': 1},
+    'C2H5OH': {'molecular_weight': 46.07, 'n_atoms': 9, 'is_polar': 1},
+    'N2': {'molecular_weight': 28.01, 'n_atoms': 2, 'is_polar': 0},
+    'O2': {'molecular_weight': 32.00, 'n_atoms': 2, 'is_polar': 0},
+    'C6H6': {'molecular_weight': 78.11, 'n_atoms': 12, 'is_polar': 0},
+    'C8H18': {'molecular_weight': 114.23, 'n_atoms': 26, 'is_polar': 0},
+    'NaCl': {'molecular_weight': 58.44, 'n_atoms': 2, 'is_polar': 1}
+}
+
+_DEFAULT_PROPS = {'molecular_weight': 50, 'n_atoms': 5, 'is_polar': 0}
+
+def collect_hackathon_dataset(write_csv=False):
+    """Collect essential data for hackathon demo
+    
+    Args:
+        write_csv (bool): Also write a .csv copy of the training data for inspection
+    
+    Returns:
+        str: Path of the Parquet training data, read it with pd.read_parquet
+    """
     
     # Expanded list of compounds with alternative names
     target_compounds = [
@@ -30,45 +75,80 @@ def collect_hackathon_dataset():
     print("🔬 Starting NIST data collection...")
     print(f"Target compounds: {len(target_compounds)}")
     
-    # Scrape data with progress tracking
-    raw_data = {}
-    successful_scrapes = 0
-    
-    for compound in target_compounds:
-        try:
-            data = scraper.scrape_compound_data(compound)
-            if data and data['thermodynamic_data'] is not None:
-                raw_data[compound] = data
-                successful_scrapes += 1
-                print(f"✅ Successfully scraped {compound}")
-            else:
-                print(f"❌ No data found for {compound}")
-        except Exception as e:
-            print(f"❌ Error scraping {compound}: {e}")
-            continue
-    
-    print(f"Successfully scraped {successful_scrapes} compounds")
-    
-    # Save raw data if any was collected
-    if raw_data:
-        scraper.save_data(raw_data, 'hackathon_raw_data.json')
-    
-    # Process into training dataset
-    training_data = process_for_training(raw_data)
-    
-    # If still not enough data, add synthetic data
-    if len(training_data) < 50:
-        print("Adding synthetic data to supplement NIST data...")
-        synthetic_data = generate_synthetic_supplement(len(training_data))
-        training_data = pd.concat([training_data, synthetic_data], ignore_index=True)
-    
-    # Save processed data
-    training_data.to_csv('hackathon_training_data.csv', index=False)
-    
-    print(f"✅ Collection complete! {len(training_data)} data points collected")
-    print(f"📁 Files saved: hackathon_raw_data.json, hackathon_training_data.csv")
-    
-    return training_data
+    scraped_compounds = set()
+    n_samples = 0
+    
+    # Raw data goes to a temporary file and only replaces hackathon_raw_data.json
+    # once a scrape has finished and found something
+    raw_tmp_path = f'{RAW_DATA_PATH}.tmp'
+    
+    try:
+        # Stream each compound's raw data and samples to disk as soon as it is scraped,
+        # so only one compound's rows are held in memory at a time
+        with pq.ParquetWriter(TRAINING_DATA_PATH, TRAINING_SCHEMA, compression='snappy') as writer, \
+                open(raw_tmp_path, 'wb') as raw_file:
+            
+            def write_samples(samples):
+                nonlocal n_samples
+                writer.write_table(pa.Table.from_pandas(samples, schema=TRAINING_SCHEMA,
+                                                        preserve_index=False))
+                n_samples += len(samples)
+            
+            def on_result(compound, data):
+                if data['thermodynamic_data'] is None:
+                    return
+                
+                # Same layout as scraper.save_data, written one complete entry at a time
+                entry = orjson.dumps(compound) + b':' + orjson.dumps(
+                    scraper.serialize_compound(data), option=orjson.OPT_SERIALIZE_NUMPY
+                )
+                raw_file.write((b',' if scraped_compounds else b'{') + entry)
+                scraped_compounds.add(compound)
+                
+                samples = process_for_training({compound: data})
+                if len(samples):
+                    write_samples(samples)
+            
+            # Scrape all compounds concurrently
+            scraper.scrape_multiple_compounds(target_compounds, save_progress=False,
+                                              on_result=on_result)
+            raw_file.write(b'}')
+            
+            for compound in target_compounds:
+                if compound in scraped_compounds:
+                    print(f"✅ Successfully scraped {compound}")
+                else:
+                    print(f"❌ No data found for {compound}")
+            
+            print(f"Successfully scraped {len(scraped_compounds)} compounds")
+            
+            # If still not enough data, add synthetic data
+            if n_samples < 50:
+                print("Adding synthetic data to supplement NIST data...")
+                write_samples(generate_synthetic_supplement(n_samples))
+        
+    except BaseException:
+        if os.path.exists(raw_tmp_path):
+            os.remove(raw_tmp_path)
+        raise
+    
+    if scraped_compounds:
+        os.replace(raw_tmp_path, RAW_DATA_PATH)
+    else:
+        os.remove(raw_tmp_path)
+    
+    if write_csv:
+        # Copy batch by batch rather than loading the whole file
+        parquet_file = pq.ParquetFile(TRAINING_DATA_PATH)
+        for i, batch in enumerate(parquet_file.iter_batches()):
+            batch.to_pandas().to_csv(CSV_DATA_PATH, mode='w' if i == 0 else 'a',
+                                     header=(i == 0), index=False)
+    
+    print(f"✅ Collection complete! {n_samples} data points collected")
+    saved_files = [RAW_DATA_PATH, TRAINING_DATA_PATH] if scraped_compounds else [TRAINING_DATA_PATH]
+    print(f"📁 Files saved: {', '.join(saved_files)}")
+    
+    return TRAINING_DATA_PATH
 
 def process_for_training(raw_data):
     """Process raw NIST data into ML-ready format"""
@@ -78,44 +158,38 @@ def process_for_training(raw_data):
         if data['thermodynamic_data'] is not None:
             df = data['thermodynamic_data']
             
-            # Clean and filter data
-            df = df.dropna(subset=['temperature', 'heat_capacity'])
-            df = df[(df['temperature'] >= 200) & (df['temperature'] <= 2000)]
+            # Clean and filter data (columns are already float64)
+            df = df.dropna(subset=['temperature', 'heat_capacity']).query('200 <= temperature <= 2000')
             
-            # Create training samples
-            for _, row in df.iterrows():
-                sample = {
-                    'compound': compound,
-                    'compound_id': hash(compound) % 1000,  # Simple encoding
-                    'temperature': row['temperature'],
-                    'heat_capacity': row['heat_capacity'],
-                    'entropy': row.get('entropy', np.nan),
-                    'enthalpy_minus_h298': row.get('enthalpy_minus_h298', np.nan),
-                }
-                
-                # Add molecular properties
-                sample.update(get_molecular_properties(compound))
-                
-                training_samples.append(sample)
+            # Build the compound's samples column-wise
+            samples = pd.DataFrame({
+                'compound': compound,
+                'compound_id': compound_code(compound),
+                'temperature': df['temperature'],
+                'heat_capacity': df['heat_capacity'],
+                'entropy': df.get('entropy', np.nan),
+                'enthalpy_minus_h298': df.get('enthalpy_minus_h298', np.nan),
+            })
+            
+            # Add molecular properties
+            for name, value in get_molecular_properties(compound).items():
+                samples[name] = value
+            
+            training_samples.append(samples)
     
-    return pd.DataFrame(training_samples)
+    if not training_samples:
+        return pd.DataFrame()
+    
+    return pd.concat(training_samples, ignore_index=True)
+
+def compound_code(compound):
+    """Simple stable encoding of a compound name, the same on every run"""
+    # hash() is salted per interpreter (PYTHONHASHSEED), crc32 is not
+    return zlib.crc32(compound.encode()) % 1000
 
 def get_molecular_properties(compound):
     """Get basic molecular properties for compounds"""
-    properties = {
-        'H2O': {'molecular_weight': 18.015, 'n_atoms': 3, 'is_polar': 1},
-        'CO2': {'molecular_weight': 44.01, 'n_atoms': 3, 'is_polar': 0},
-        'CH4': {'molecular_weight': 16.04, 'n_atoms': 5, 'is_polar': 0},
-        'NH3': {'molecular_weight': 17.03, 'n_atoms': 4, 'is_polar': 1},
-        'C2H5OH': {'molecular_weight': 46.07, 'n_atoms': 9, 'is_polar': 1},
-        'N2': {'molecular_weight': 28.01, 'n_atoms': 2, 'is_polar': 0},
-        'O2': {'molecular_weight': 32.00, 'n_atoms': 2, 'is_polar': 0},
-        'C6H6': {'molecular_weight': 78.11, 'n_atoms': 12, 'is_polar': 0},
-        'C8H18': {'molecular_weight': 114.23, 'n_atoms': 26, 'is_polar': 0},
-        'NaCl': {'molecular_weight': 58.44, 'n_atoms': 2, 'is_polar': 1}
-    }
-    
-    return properties.get(compound, {'molecular_weight': 50, 'n_atoms': 5, 'is_polar': 0})
+    return _MOL_PROPS.get(compound, _DEFAULT_PROPS)
 
 def generate_synthetic_supplement(existing_count):
     """Generate synthetic data to supplement NIST data"""
@@ -127,31 +201,33 @@ def generate_synthetic_supplement(existing_count):
     target_samples = max(100 - existing_count, 0)
     samples_per_compound = max(target_samples // len(compounds), 5)
     
+    rng = np.random.default_rng()
+    
     for compound in compounds:
         mol_props = get_molecular_properties(compound)
+        n = samples_per_compound
         
         # Generate realistic temperature range
-        temps = np.linspace(200, 2000, samples_per_compound)
+        temps = np.linspace(200, 2000, n)
         
-        for temp in temps:
-            # Generate realistic heat capacity using simplified correlations
-            base_cp = 20 + mol_props['n_atoms'] * 5  # Base heat capacity
-            temp_effect = 0.01 * temp + 0.000001 * temp**2  # Temperature dependence
-            cp = base_cp + temp_effect + np.random.normal(0, 2)
-            
-            # Generate correlated entropy
-            entropy = 150 + np.log(temp) * 20 + mol_props['n_atoms'] * 10 + np.random.normal(0, 5)
-            
-            sample = {
-                'compound': compound,
-                'compound_id': hash(compound) % 1000,
-                'temperature': temp,
-                'heat_capacity': max(cp, 10),  # Ensure positive
-                'entropy': max(entropy, 0),
-                'enthalpy_minus_h298': np.random.normal(0, 1000),
-                **mol_props
-            }
-            
-            synthetic_samples.append(sample)
-    
-    return pd.DataFrame(synthetic_samples)
\ No newline at end of file
+        # Generate realistic heat capacity using simplified correlations
+        base_cp = 20 + mol_props['n_atoms'] * 5  # Base heat capacity
+        temp_effect = 0.01 * temps + 0.000001 * temps**2  # Temperature dependence
+        cp = np.maximum(base_cp + temp_effect + rng.normal(0, 2, n), 10)  # Ensure positive
+        
+        # Generate correlated entropy
+        entropy = np.maximum(
+            150 + np.log(temps) * 20 + mol_props['n_atoms'] * 10 + rng.normal(0, 5, n), 0
+        )
+        
+        synthetic_samples.append(pd.DataFrame({
+            'compound': compound,
+            'compound_id': compound_code(compound),
+            'temperature': temps,
+            'heat_capacity': cp,
+            'entropy': entropy,
+            'enthalpy_minus_h298': rng.normal(0, 1000, n),
+            **mol_props
+        }))
+    
+    return pd.concat(synthetic_samples, ignore_index=True)